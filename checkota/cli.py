@@ -2,7 +2,9 @@
 top-level run orchestration (sequential and parallel)."""
 
 import argparse
+import copy
 import io
+import os
 import signal
 import time
 from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
@@ -27,6 +29,41 @@ from checkota.runtime import (
 )
 
 
+def _jobs_arg(value: str) -> int | str:
+    if value.strip().lower() == "auto":
+        return "auto"
+    try:
+        return int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"invalid value {value!r} (expected an integer or 'auto')"
+        ) from None
+
+
+def auto_jobs(task_count: int) -> int:
+    """Worker count for --jobs auto: 4 per CPU, capped at the number of tasks.
+
+    Checks are network-bound, so threads mostly wait on sockets; there is no
+    point starting more workers than there are (config, variant) tasks.
+    """
+    return max(1, min(task_count, 4 * (os.cpu_count() or 1)))
+
+
+def _count_variant_tasks(config_paths: list[Path], args: argparse.Namespace) -> int:
+    """Number of (config, variant) tasks _run_global_pool would schedule.
+
+    Uses the same load_config_variants as the pool (YAML parses are cached, so
+    the later load is free), with its output discarded. A config that fails to
+    load counts as one task; its error is reported when it is processed.
+    """
+    total = 0
+    for path in config_paths:
+        with Log.capture(io.StringIO()):
+            status, variants = load_config_variants(path, args)
+        total += len(variants) if status == 0 else 1
+    return total
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Android OTA Update Checker")
     parser.add_argument("--debug", action="store_true", help="Enable debugging")
@@ -84,9 +121,11 @@ def build_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument(
         "--jobs",
-        type=int,
+        type=_jobs_arg,
         default=1,
-        help="Number of config files to process in parallel when using --config-dir (default: 1)",
+        help="Number of config files to process in parallel when using --config-dir"
+        " (default: 1). 'auto' uses 4 per CPU, capped at the number of"
+        " (config, variant) tasks.",
     )
     parser.add_argument(
         "--timeout",
@@ -175,7 +214,7 @@ def _run_sequential(
     for idx, config_path in enumerate(config_paths, start=1):
         if ctx.stop_event.is_set():
             return 130
-        local_args = argparse.Namespace(**vars(args))
+        local_args = copy.copy(args)
         if idx > 1:
             Log.raw("")
         header = (
@@ -229,7 +268,7 @@ def _run_global_pool(
     ) -> tuple[int, int, int, str]:
         if ctx.stop_event.is_set():
             return config_idx, variant_idx, 130, ""
-        local_args = argparse.Namespace(**vars(args))
+        local_args = copy.copy(args)
         buffer = io.StringIO()
         try:
             with Log.capture(buffer):
@@ -240,9 +279,10 @@ def _run_global_pool(
                     Log.i(f"Override incremental: {args.incremental}")
                 result = process_config_variant(ctx, cfg, path, local_args, cfg.variant)
         except Exception as exc:
-            buffer.write(
-                f"\033[91m✗\033[0m {path} variant {variant_idx} failed with unhandled exception: {exc}\n"
-            )
+            with Log.capture(buffer):
+                Log.e(
+                    f"{path} variant {variant_idx} failed with unhandled exception: {exc}"
+                )
             result = 1
         return config_idx, variant_idx, result, buffer.getvalue()
 
@@ -330,6 +370,15 @@ def main() -> int:
     args = parser.parse_args()
     _validate_args(parser, args)
 
+    config_paths: list[Path] = []
+    if not args.fp:
+        config_paths = _collect_config_paths(parser, args)
+    # Resolve before building the RunContext so the per-thread HTTP pool is
+    # sized from the real worker count.
+    if args.jobs == "auto":
+        args.jobs = auto_jobs(_count_variant_tasks(config_paths, args))
+        Log.i(f"--jobs auto: using {args.jobs} worker(s)")
+
     args.run_context = create_run_context(args.dry_run, pool_size=max(1, args.jobs))
     ctx = args.run_context
     previous_sigint = install_interrupt_handler(ctx)
@@ -365,7 +414,6 @@ def main() -> int:
         else:
             args.no_config = False
 
-            config_paths = _collect_config_paths(parser, args)
             if not config_paths:
                 exit_code = 1
             elif args.jobs < 1:
@@ -38,4 +38,3 @@ SECTION_HEADER_RE = re.compile(r"(?:^|\n)([A-Z][A-Za-z0-9 \t&:/(),.\-]{1,80})<br
 DESC_SECTION_RE = re.compile(
     r"(<b>Title:</b> .*?\n(?:<b>OS:</b> .*?\n)?\n?)(.*?)(\n\n?<b>Size:</b>)", re.DOTALL
 )
-SENTENCE_BOUNDARY_RE = re.compile(r"\.\s+")
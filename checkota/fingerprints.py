@@ -12,7 +12,7 @@ def load_processed_titles(path: Path) -> set[str]:
         return set()
     try:
         with path.open("r", encoding="utf-8") as handle:
-            return {line.strip() for line in handle if line.strip()}
+            return {title for line in handle if (title := line.strip())}
     except Exception as exc:
         Log.e(f"Error reading processed updates file {path}: {exc}")
         return set()
@@ -29,13 +29,20 @@ def save_processed_title(path: Path, title: str) -> None:
 
 
 def _trim_processed(path: Path, max_entries: int = MAX_PROCESSED_ENTRIES) -> None:
-    """Trim the processed updates file, keeping only the most recent entries."""
+    """Trim the processed updates file, keeping only the most recent entries.
+
+    Runs after every save, so the common under-limit case only counts newlines
+    in the raw bytes; lines are decoded and split only when a trim is due.
+    """
     try:
+        data = path.read_bytes()
+        line_count = data.count(b"\n") + (0 if data.endswith(b"\n") else 1)
+        if line_count <= max_entries:
+            return
         with path.open("r", encoding="utf-8") as f:
             lines = f.readlines()
-        if len(lines) > max_entries:
-            with path.open("w", encoding="utf-8") as f:
-                f.writelines(lines[-max_entries:])
-            Log.i(f"Trimmed {path} to {max_entries} most recent entries.")
+        with path.open("w", encoding="utf-8") as f:
+            f.writelines(lines[-max_entries:])
+        Log.i(f"Trimmed {path} to {max_entries} most recent entries.")
     except Exception:
         pass
@@ -1,3 +1,4 @@
+import os
 import sys
 import threading
 from contextlib import contextmanager
@@ -9,26 +10,46 @@ def _stream():
     return getattr(_thread_local, "stream", sys.stdout)
 
 
+# Any non-empty NO_COLOR turns off ANSI colours (https://no-color.org).
+_COLOR = not os.environ.get("NO_COLOR")
+
+
+def _prefix(color_code, symbol):
+    return f"\033[{color_code}m{symbol}\033[0m " if _COLOR else f"{symbol} "
+
+
+_INFO = _prefix("94", "=>")
+_SUCCESS = _prefix("92", "✓")
+_ERROR = _prefix("91", "✗")
+_WARNING = _prefix("93", "!")
+
+
+def _write(prefix, message):
+    # One write per line instead of print(): no sep/end handling, and the
+    # prefix strings are built once at import.
+    _stream().write(f"{prefix}{message}\n")
+
+
 class Log:
     @staticmethod
     def i(message):
-        print(f"\033[94m=>\033[0m {message}", file=_stream())
+        _write(_INFO, message)
 
     @staticmethod
     def s(message):
-        print(f"\033[92m✓\033[0m {message}", file=_stream())
+        _write(_SUCCESS, message)
 
     @staticmethod
     def e(message):
-        print(f"\033[91m✗\033[0m {message}", file=_stream())
+        _write(_ERROR, message)
 
     @staticmethod
     def w(message):
-        print(f"\033[93m!\033[0m {message}", file=_stream())
+        _write(_WARNING, message)
 
     @staticmethod
     def raw(message=""):
-        print(message, file=_stream())
+        _write("", message)
 
     @staticmethod
     @contextmanager
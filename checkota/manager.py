@@ -1,14 +1,54 @@
 from dataclasses import dataclass, fields
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 import re
 
-import yaml
-
 from checkota.constants import REGION_CODE_MAP
 from checkota.logging import Log
 
 
+def _safe_load_yaml(stream: Any) -> Any:
+    """yaml.safe_load using the libyaml-backed CSafeLoader when available.
+
+    PyYAML is imported here rather than at module level: --fp runs never touch
+    YAML, so they skip the import cost.
+    """
+    import yaml
+
+    return yaml.load(stream, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+# (path, st_mtime_ns, st_size) -> (raw text, parsed YAML). A changed file gets a
+# new key, so stale entries are never served; callers must not mutate the
+# parsed data.
+_YAML_CACHE: dict[tuple[str, int, int], tuple[str, Any]] = {}
+_YAML_CACHE_MAX = 256
+
+
+def _read_config_yaml(path: Path) -> tuple[str, Any]:
+    """Return (raw_text, parsed) for a config file, reusing an unchanged parse."""
+    st = path.stat()
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    cached = _YAML_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    raw_text = path.read_text(encoding="utf-8")
+    entry = (raw_text, _safe_load_yaml(raw_text))
+    if len(_YAML_CACHE) >= _YAML_CACHE_MAX:
+        _YAML_CACHE.clear()
+    _YAML_CACHE[key] = entry
+    return entry
+
+
+def _forget_config_yaml(path: Path) -> None:
+    """Drop every cached parse of path (call after writing to it)."""
+    name = str(path)
+    for key in [key for key in _YAML_CACHE if key[0] == name]:
+        _YAML_CACHE.pop(key, None)
+
+
 @dataclass
 class Config:
     build_tag: str
@@ -51,8 +91,7 @@ class Config:
         if not file.is_file():
             raise FileNotFoundError(f"Config file not found: {file}")
 
-        with open(file, encoding="utf-8") as handle:
-            data = yaml.safe_load(handle)
+        _, data = _read_config_yaml(file)
 
         if not isinstance(data, dict):
             raise ValueError("Config file content is not a valid dictionary.")
@@ -91,6 +130,7 @@ class Config:
         )
 
 
+@lru_cache(maxsize=256)
 def region_code_from_product(product: str) -> str | None:
     """Extract region code from product name (everything after the first '-')."""
     if not product or "-" not in product:
@@ -98,6 +138,7 @@ def region_code_from_product(product: str) -> str | None:
     return product.split("-", 1)[1].strip().upper()
 
 
+@lru_cache(maxsize=256)
 def region_from_product(product: str) -> str | None:
     """Get human-readable region name from product name."""
     code = region_code_from_product(product)
@@ -129,11 +170,17 @@ def update_config_from_fingerprint(
         "incremental": parsed["incremental"],
     }
 
+    # Reuses the parse from Config.from_yaml when the file is unchanged. A file
+    # that no longer parses is still rewritten via the top-level line path.
     try:
-        raw_text = config_path.read_text(encoding="utf-8")
-    except Exception as exc:
-        Log.w(f"Failed to read config file {config_path}: {exc}")
-        return False
+        raw_text, data = _read_config_yaml(config_path)
+    except Exception:
+        try:
+            raw_text = config_path.read_text(encoding="utf-8")
+        except Exception as exc:
+            Log.w(f"Failed to read config file {config_path}: {exc}")
+            return False
+        data = None
 
     lines = raw_text.splitlines(keepends=True)
 
@@ -198,11 +245,6 @@ def update_config_from_fingerprint(
     def insert_key_line(start_idx: int, indent: int, key: str, value: str) -> None:
         lines.insert(start_idx, " " * indent + f'{key}: "{value}"\n')
 
-    try:
-        data = yaml.safe_load(raw_text)
-    except Exception:
-        data = None
-
     if isinstance(data, dict) and isinstance(data.get("variants"), list):
         variants: list[dict[str, Any]] = data["variants"]
         match_idx: int | None = None
@@ -313,12 +355,15 @@ def update_config_from_fingerprint(
     except Exception as exc:
         Log.w(f"Failed to write updated config {config_path}: {exc}")
         return False
+    finally:
+        # mtime granularity may hide a same-size rewrite from the cache key.
+        _forget_config_yaml(config_path)
 
     # Post-write round-trip smoke test: ensure the rewritten file still parses
     # as a valid config. Catches corrupted writes (e.g. comment-collision
     # rewrites) before the next run attempts to load the file.
     try:
-        reparse = yaml.safe_load(config_path.read_text(encoding="utf-8"))
+        _, reparse = _read_config_yaml(config_path)
         if not isinstance(reparse, dict):
             raise ValueError(f"Round-trip parse yielded {type(reparse).__name__}")
     except Exception as exc:
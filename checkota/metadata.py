@@ -1,6 +1,7 @@
 import threading
 import datetime
 import time
+from functools import lru_cache
 from pathlib import Path
 
 import requests
@@ -153,6 +154,7 @@ def extract_incremental_from_fingerprint(fingerprint: str) -> str | None:
     return incremental_segment.split(":", 1)[0] if incremental_segment else None
 
 
+@lru_cache(maxsize=256)
 def build_sdk_strings(
     sdk_level: str | None, android_version: str | None
 ) -> tuple[str, str, str]:
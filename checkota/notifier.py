@@ -29,7 +29,14 @@ def create_notifier(ctx: RunContext, args: argparse.Namespace) -> TgNotify | Non
         return None
 
     try:
-        return TgNotify(token, chat, telegraph_token, session=ctx.session())
+        return TgNotify(
+            token,
+            chat,
+            telegraph_token,
+            session=ctx.session(),
+            page_cache=ctx.telegraph_pages,
+            cache_lock=ctx.cache_lock,
+        )
     except ValueError as exc:
         Log.e(f"Telegram setup failed: {exc}")
         return None
@@ -53,31 +60,33 @@ def build_notification_message(update: VariantUpdate) -> str:
     inc = update.data.get("post_build_incremental")
     spl = update.data.get("post_security_patch_level")
     build_date = update.data.get("build_date")
-    return (
-        f"<blockquote><b>OTA Update Available</b></blockquote>\n\n"
-        f"<b>Device:</b> {E(str(update.cfg.model), quote=False)}{E(region_line_raw, quote=False)}\n"
-        f"\n"
-        f"<b>Title:</b> {E(str(update.title), quote=False)}\n"
-        f"{os_line}\n"
+
+    # Collected as parts and joined once instead of chaining "+" over
+    # conditional f-strings (one intermediate string per optional line).
+    parts = [
+        "<blockquote><b>OTA Update Available</b></blockquote>\n\n",
+        (
+            f"<b>Device:</b> {E(str(update.cfg.model), quote=False)}"
+            f"{E(region_line_raw, quote=False)}\n\n"
+        ),
+        f"<b>Title:</b> {E(str(update.title), quote=False)}\n",
+        f"{os_line}\n",
         # OTA descriptions are HTML-ish (<small>/<font>/<br>) and must stay
         # raw here so TgNotify._sanitize_html can normalize them before send.
-        f"{str(update.desc)}\n\n"
-        f"<b>Size:</b> {E(str(update.size), quote=False)}\n"
-        + (
-            f"<b>Incremental:</b> <code>{E(str(inc), quote=False)}</code>\n"
-            if inc
-            else ""
-        )
-        + (f"<b>Security patch:</b> {E(str(spl), quote=False)}\n" if spl else "")
-        + f"<b>Fingerprint:</b> <code>{E(str(update.target_fp), quote=False)}</code>"
-        + (
-            f"\n<b>Build date:</b> {E(str(build_date), quote=False)} (CST)"
-            if build_date
-            else ""
-        )
-        + (
+        f"{str(update.desc)}\n\n",
+        f"<b>Size:</b> {E(str(update.size), quote=False)}\n",
+    ]
+    if inc:
+        parts.append(f"<b>Incremental:</b> <code>{E(str(inc), quote=False)}</code>\n")
+    if spl:
+        parts.append(f"<b>Security patch:</b> {E(str(spl), quote=False)}\n")
+    parts.append(
+        f"<b>Fingerprint:</b> <code>{E(str(update.target_fp), quote=False)}</code>"
+    )
+    if build_date:
+        parts.append(f"\n<b>Build date:</b> {E(str(build_date), quote=False)} (CST)")
+    if update.url:
+        parts.append(
             f"\n<b>Google OTA link:</b> <code>{E(update.url, quote=False)}</code>"
-            if update.url
-            else ""
         )
-    )
+    return "".join(parts)
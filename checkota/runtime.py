@@ -30,6 +30,10 @@ class RunContext:
     _metadata_inflight: dict[str, threading.Event] = field(
         default_factory=dict, repr=False
     )
+    # (title, content) -> Telegraph URL. Variants of one device usually share
+    # the same changelog, so each page is published once per run; failures are
+    # not stored so a later send can retry. Guarded by cache_lock.
+    telegraph_pages: dict[tuple[str, str], str] = field(default_factory=dict)
     file_lock: threading.Lock = field(default_factory=threading.Lock)
     telegram_lock: threading.Lock = field(default_factory=threading.Lock)
     cache_lock: threading.Lock = field(default_factory=threading.Lock)
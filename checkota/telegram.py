@@ -1,16 +1,71 @@
 from __future__ import annotations
 
 import re
+import threading
+
 import requests
 
 from checkota.constants import (
     DESC_SECTION_RE,
     SECTION_HEADER_RE,
-    SENTENCE_BOUNDARY_RE,
     TELEGRAPH_API_URL,
 )
 from checkota.logging import Log
 
+# Trusted Telegram HTML tags kept verbatim by _escape_text_preserving_telegram_tags.
+_TELEGRAM_TAG_RE = re.compile(
+    r"</?(?:b|code|blockquote)>|<a\s+href=\"[^\"]+\">|</a>", flags=re.IGNORECASE
+)
+# Bare "&" that does not already start a numeric or named entity.
+_BARE_AMP_RE = re.compile(r"&(?!#\d+;|#x[0-9A-Fa-f]+;|[A-Za-z][A-Za-z0-9]+;)")
+_TITLE_LINE_RE = re.compile(r"<b>Title:</b> (.*?)\n")
+# <small>, <font> and <a> open/close tags (text is kept). Applied one after
+# another, in this order: a single alternation would let the [^>]* of a stray
+# "< a" or "<font" run across a later tag and delete changelog text.
+_UNSUPPORTED_TAG_RES = tuple(
+    re.compile(pattern, flags=re.IGNORECASE)
+    for pattern in (
+        r"<\s*/?\s*small\s*>",
+        r"<\s*font\b[^>]*>",
+        r"</\s*font\s*>",
+        r"<\s*a\b[^>]*>",
+        r"</\s*a\s*>",
+    )
+)
+
+
+def _strip_unsupported_tags(text: str) -> str:
+    for pattern in _UNSUPPORTED_TAG_RES:
+        text = pattern.sub("", text)
+    return text
+
+
+# Patterns below are used on every send; compiled once instead of going
+# through the re module cache per call.
+_BR_TAG_RE = re.compile(r"<\s*br\s*/?\s*>", flags=re.IGNORECASE)
+# A <br> plus trailing inline whitespace and at most one newline.
+_BR_LINE_RE = re.compile(r"<\s*br\s*/?\s*>[^\S\n]*\n?", flags=re.IGNORECASE)
+_PARAGRAPH_SPLIT_RE = re.compile(r"\n\n+")
+_BOLD_RE = re.compile(r"<b>(.*?)</b>")
+_COLON_BLANK_RE = re.compile(r":\n\n")
+_BLANK_BEFORE_DASH_RE = re.compile(r"\n\n(-\s+)")
+_BLANK_BEFORE_NUMBER_RE = re.compile(r"\n\n(\d+\.)")
+_DASH_SPACES_RE = re.compile(r"-\s{2,}")
+_PAREN_URL_RE = re.compile(r"[ \t]*\(\s*https?://[^\)]*\)")
+_LEADING_INDENT_RE = re.compile(r"\n[ \t]+")
+_INLINE_SPACES_RE = re.compile(r"[ \t]{2,}")
+# Bullet characters become "- "; a stray "Â" (mis-decoded UTF-8) is dropped.
+_BULLET_TRANS = str.maketrans(
+    {
+        "\u2022": "- ",
+        "\u2023": "- ",
+        "\u2043": "- ",
+        "\u2219": "- ",
+        "\xb7": "- ",
+        "\u00c2": None,
+    }
+)
+
 
 class TgNotify:
     MAX_LEN = 4090
@@ -22,6 +77,8 @@ class TgNotify:
         chat_id: str,
         telegraph_token: str,
         session: requests.Session | None = None,
+        page_cache: dict[tuple[str, str], str] | None = None,
+        cache_lock: threading.Lock | None = None,
     ):
         if not token or not chat_id:
             raise ValueError("Bot token and chat ID required")
@@ -32,6 +89,10 @@ class TgNotify:
         self.telegraph_token = telegraph_token
         self.url = f"https://api.telegram.org/bot{token}"
         self.session = session or requests.Session()
+        # (title, content) -> Telegraph URL for pages created this run (see
+        # RunContext.telegraph_pages); None disables reuse.
+        self.page_cache = page_cache
+        self.cache_lock = cache_lock or threading.Lock()
 
     @staticmethod
     def _html_to_telegraph_nodes(html_content: str) -> list:
@@ -45,16 +106,12 @@ class TgNotify:
           - Strips any leftover <small>, <font>, <a> tags (keeps text)
         """
         # Strip tags that Telegraph doesn't support, keep text content
-        cleaned = re.sub(r"<\s*/?\s*small\s*>", "", html_content, flags=re.IGNORECASE)
-        cleaned = re.sub(r"<\s*font\b[^>]*>", "", cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r"</\s*font\s*>", "", cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r"<\s*a\b[^>]*>", "", cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r"</\s*a\s*>", "", cleaned, flags=re.IGNORECASE)
+        cleaned = _strip_unsupported_tags(html_content)
         # Normalize any leftover <br> variants to newlines (defensive)
-        cleaned = re.sub(r"<\s*br\s*/?\s*>", "\n", cleaned, flags=re.IGNORECASE)
+        cleaned = _BR_TAG_RE.sub("\n", cleaned)
 
         # Split into paragraphs by double+ newlines
-        paragraphs = re.split(r"\n\n+", cleaned)
+        paragraphs = _PARAGRAPH_SPLIT_RE.split(cleaned)
 
         nodes = []
         for para in paragraphs:
@@ -75,7 +132,7 @@ class TgNotify:
                 # Parse inline <b>bold</b> tags within this line
                 line_children = []
                 last_end = 0
-                for match in re.finditer(r"<b>(.*?)</b>", line):
+                for match in _BOLD_RE.finditer(line):
                     if match.start() > last_end:
                         text = line[last_end : match.start()]
                         if text:
@@ -101,6 +158,13 @@ class TgNotify:
         return nodes if nodes else [{"tag": "p", "children": [html_content]}]
 
     def _create_telegraph_page(self, title: str, content: str) -> str | None:
+        if self.page_cache is not None:
+            with self.cache_lock:
+                cached = self.page_cache.get((title, content))
+            if cached:
+                Log.i(f"Reusing Telegraph page: {cached}")
+                return cached
+
         try:
             content_nodes = self._html_to_telegraph_nodes(content)
 
@@ -120,6 +184,9 @@ class TgNotify:
             if result.get("ok"):
                 telegraph_url = result["result"]["url"]
                 Log.s(f"Created Telegraph page: {telegraph_url}")
+                if self.page_cache is not None:
+                    with self.cache_lock:
+                        self.page_cache[(title, content)] = telegraph_url
                 return telegraph_url
             Log.w(f"Telegraph API error: {result}")
             return None
@@ -146,12 +213,10 @@ class TgNotify:
 
         truncated = desc[:effective_max_len]
 
-        sentence_endings = [
-            match.end() - 1 for match in SENTENCE_BOUNDARY_RE.finditer(truncated)
-        ]
+        sentence_end = self._last_sentence_end(truncated)
 
-        if sentence_endings and sentence_endings[-1] > effective_max_len * 0.6:
-            result = truncated[: sentence_endings[-1] + 1]
+        if sentence_end > effective_max_len * 0.6:
+            result = truncated[: sentence_end + 1]
         else:
             last_paragraph = truncated.rfind("\n\n")
             if last_paragraph > effective_max_len * 0.5:
@@ -170,33 +235,39 @@ class TgNotify:
         result += link_text
         return result
 
+    @staticmethod
+    def _last_sentence_end(text: str) -> int:
+        """Index of the last whitespace char after the final '.'-plus-whitespace.
+
+        Equivalent to the end of the last ``\\.\\s+`` match minus one, found with
+        a reverse rfind scan instead of materializing every regex match.
+        Returns -1 when the text has no sentence boundary.
+        """
+        end = len(text) - 1
+        while True:
+            pos = text.rfind(".", 0, end)
+            if pos < 0:
+                return -1
+            if text[pos + 1].isspace():
+                pos += 1
+                while pos + 1 < len(text) and text[pos + 1].isspace():
+                    pos += 1
+                return pos
+            end = pos
+
     @staticmethod
     def _escape_text_preserving_telegram_tags(html: str) -> str:
         """Escape text nodes while preserving trusted Telegram HTML tags."""
-        tag_re = re.compile(
-            r"</?(?:b|code|blockquote)>|<a\s+href=\"[^\"]+\">|</a>",
-            flags=re.IGNORECASE,
-        )
         pieces: list[str] = []
         last_end = 0
-        for match in tag_re.finditer(html):
+        for match in _TELEGRAM_TAG_RE.finditer(html):
             if match.start() > last_end:
-                text = html[last_end : match.start()]
-                text = re.sub(
-                    r"&(?!#\d+;|#x[0-9A-Fa-f]+;|[A-Za-z][A-Za-z0-9]+;)",
-                    "&amp;",
-                    text,
-                )
+                text = _BARE_AMP_RE.sub("&amp;", html[last_end : match.start()])
                 pieces.append(text.replace("<", "&lt;").replace(">", "&gt;"))
             pieces.append(match.group(0))
             last_end = match.end()
         if last_end < len(html):
-            text = html[last_end:]
-            text = re.sub(
-                r"&(?!#\d+;|#x[0-9A-Fa-f]+;|[A-Za-z][A-Za-z0-9]+;)",
-                "&amp;",
-                text,
-            )
+            text = _BARE_AMP_RE.sub("&amp;", html[last_end:])
             pieces.append(text.replace("<", "&lt;").replace(">", "&gt;"))
         return "".join(pieces)
 
@@ -224,24 +295,16 @@ class TgNotify:
         # --- Step 2: Replace <br> with newlines ---
         # Consume inline whitespace after <br> plus at most one \n,
         # so <br>\n becomes \n (not \n\n) but <br>\n\n keeps \n\n.
-        sanitized = re.sub(
-            r"<\s*br\s*/?\s*>[^\S\n]*\n?", "\n", sanitized, flags=re.IGNORECASE
-        )
+        sanitized = _BR_LINE_RE.sub("\n", sanitized)
 
         # --- Step 3: Strip unsupported HTML tags ---
-        sanitized = re.sub(r"<\s*/?\s*small\s*>", "", sanitized, flags=re.IGNORECASE)
-        sanitized = re.sub(r"<\s*font\b[^>]*>", "", sanitized, flags=re.IGNORECASE)
-        sanitized = re.sub(r"</\s*font\s*>", "", sanitized, flags=re.IGNORECASE)
-        # Strip all <a> tags, keeping their text content.
-        # Telegram HTML only allows <a href="...">, and arbitrary links from OTA
-        # descriptions should not be sent as clickable URLs.
-        sanitized = re.sub(r"<\s*a\b[^>]*>", "", sanitized, flags=re.IGNORECASE)
-        sanitized = re.sub(r"</\s*a\s*>", "", sanitized, flags=re.IGNORECASE)
+        # <a> tags are stripped too (text kept): Telegram HTML only allows
+        # <a href="...">, and arbitrary links from OTA descriptions should not
+        # be sent as clickable URLs.
+        sanitized = _strip_unsupported_tags(sanitized)
 
         # --- Step 4: Normalize common bullet characters ---
-        for bullet in ("\u2022", "\u2023", "\u2043", "\u2219", "\xb7"):
-            sanitized = sanitized.replace(bullet, "- ")
-        sanitized = sanitized.replace("\u00c2", "")
+        sanitized = sanitized.translate(_BULLET_TRANS)
 
         # --- Step 5: Normalize whitespace ---
         # Collapse extra spaces on blank lines and limit consecutive blanks.
@@ -258,13 +321,13 @@ class TgNotify:
                 prev_blank = True
 
         sanitized = "\n".join(lines).strip()
-        sanitized = re.sub(r":\n\n", ":\n", sanitized)
-        sanitized = re.sub(r"\n\n(-\s+)", r"\n\1", sanitized)
-        sanitized = re.sub(r"\n\n(\d+\.)", r"\n\1", sanitized)
-        sanitized = re.sub(r"-\s{2,}", "- ", sanitized)
-        sanitized = re.sub(r"[ \t]*\(\s*https?://[^\)]*\)", "", sanitized)
-        sanitized = re.sub(r"\n[ \t]+", "\n", sanitized)
-        sanitized = re.sub(r"[ \t]{2,}", " ", sanitized)
+        sanitized = _COLON_BLANK_RE.sub(":\n", sanitized)
+        sanitized = _BLANK_BEFORE_DASH_RE.sub(r"\n\1", sanitized)
+        sanitized = _BLANK_BEFORE_NUMBER_RE.sub(r"\n\1", sanitized)
+        sanitized = _DASH_SPACES_RE.sub("- ", sanitized)
+        sanitized = _PAREN_URL_RE.sub("", sanitized)
+        sanitized = _LEADING_INDENT_RE.sub("\n", sanitized)
+        sanitized = _INLINE_SPACES_RE.sub(" ", sanitized)
         sanitized = sanitized.replace(" \n", "\n").strip()
         return TgNotify._escape_text_preserving_telegram_tags(sanitized)
 
@@ -290,10 +353,11 @@ class TgNotify:
                 description = match.group(2).strip()
                 after_desc = match.group(3)
 
-                excess_chars = len(msg) - self.MAX_LEN
-
-                if excess_chars > 0 and len(description) > self.DESC_MAX_LEN:
-                    title_match = re.search(r"<b>Title:</b> (.*?)\n", before_desc)
+                # Only the description is ever moved to Telegraph; if it is
+                # already short, an over-limit message is sent as-is rather
+                # than paying for a page that would not shorten it.
+                if len(description) > self.DESC_MAX_LEN:
+                    title_match = _TITLE_LINE_RE.search(before_desc)
                     page_title = (
                         title_match.group(1)
                         if title_match
@@ -305,8 +369,14 @@ class TgNotify:
                         description, telegraph_url=telegraph_url
                     )
 
-                    msg = msg.replace(
-                        match.group(0), before_desc + truncated_desc + after_desc
+                    msg = "".join(
+                        (
+                            msg[: match.start()],
+                            before_desc,
+                            truncated_desc,
+                            after_desc,
+                            msg[match.end() :],
+                        )
                     )
 
         try:
@@ -1,11 +1,10 @@
 import time
 import datetime
-import gzip
 from pathlib import Path
 import threading
+import zlib
 
 import requests
-from google.protobuf import text_format
 
 from checkin import checkin_generator_pb2
 from utils import functions
@@ -21,6 +20,32 @@ from checkota.constants import (
 from checkota.logging import Log
 
 
+def _build_request_template() -> checkin_generator_pb2.AndroidCheckinRequest:
+    """Check-in request fields that are identical for every device and run."""
+    payload = checkin_generator_pb2.AndroidCheckinRequest()
+    checkin = payload.checkin
+    checkin.build.timestamp = 0
+    checkin.roaming = "WIFI::"
+    checkin.userNumber = 0
+    checkin.deviceType = 2
+    checkin.voiceCapable = False
+
+    payload.id = 0
+    payload.locale = "en-US"
+    payload.timeZone = "America/New_York"
+    payload.version = 3
+    payload.macAddrType.extend(["wifi"])
+    payload.fragment = 0
+    payload.userSerialNumber = 0
+    payload.fetchSystemUpdates = 1
+    return payload
+
+
+# Built once at import; _build_request copies it and fills the per-device
+# fields, instead of assembling the whole message tree on every check.
+_REQUEST_TEMPLATE = _build_request_template()
+
+
 class UpdateChecker:
     def __init__(
         self,
@@ -54,34 +79,20 @@ class UpdateChecker:
 
     def _build_request(self) -> bytes:
         payload = checkin_generator_pb2.AndroidCheckinRequest()
-        build = checkin_generator_pb2.AndroidBuildProto()
-        checkin = checkin_generator_pb2.AndroidCheckinProto()
-
-        build.id = self.cfg.fingerprint()
-        build.timestamp = 0
-        build.device = self.cfg.device
-
-        checkin.build.CopyFrom(build)
-        checkin.roaming = "WIFI::"
-        checkin.userNumber = 0
-        checkin.deviceType = 2
-        checkin.voiceCapable = False
+        payload.CopyFrom(_REQUEST_TEMPLATE)
 
+        payload.checkin.build.id = self.cfg.fingerprint()
+        payload.checkin.build.device = self.cfg.device
         payload.imei = self._imei
-        payload.id = 0
         payload.digest = self._digest
-        payload.checkin.CopyFrom(checkin)
-        payload.locale = "en-US"
-        payload.timeZone = "America/New_York"
-        payload.version = 3
         payload.serialNumber = self._serial
         payload.macAddr.append(self._mac)
-        payload.macAddrType.extend(["wifi"])
-        payload.fragment = 0
-        payload.userSerialNumber = 0
-        payload.fetchSystemUpdates = 1
 
-        return gzip.compress(payload.SerializeToString())
+        # The request is well under 1 KiB; level 1 skips deflate's expensive
+        # match search for a negligible size difference. wbits=31 emits the gzip
+        # container directly, skipping GzipFile's Python-side header/CRC work.
+        compressor = zlib.compressobj(1, zlib.DEFLATED, 31)
+        return compressor.compress(payload.SerializeToString()) + compressor.flush()
 
     def check(self, debug: bool = False) -> tuple[bool, dict | None]:
         Log.i("Checking for updates...")
@@ -90,6 +101,7 @@ class UpdateChecker:
         retries = 3
         delay = 1
         data = self._build_request()
+        checked_at = datetime.datetime.now(datetime.timezone.utc).isoformat()
         response = None
 
         for attempt in range(retries):
@@ -109,12 +121,14 @@ class UpdateChecker:
                 resp.ParseFromString(response.content)
 
                 if debug:
+                    from google.protobuf import text_format
+
                     Path(DEBUG_FILE).write_text(
                         text_format.MessageToString(resp), encoding="utf-8"
                     )
                     Log.i(f"Debug response saved to {DEBUG_FILE}")
 
-                info = self._parse(resp)
+                info = self._parse(resp, checked_at)
                 has_update = info.get("found", False) and "url" in info
                 return has_update, info
 
@@ -161,45 +175,43 @@ class UpdateChecker:
                 return False, None
         return False, None
 
-    def _parse(self, resp: checkin_generator_pb2.AndroidCheckinResponse) -> dict:
-        info = {
-            "device": self.cfg.model,
-            "found": False,
-            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
-            "title": None,
-            "description": None,
-            "size": None,
-            "url": None,
-        }
+    def _parse(
+        self, resp: checkin_generator_pb2.AndroidCheckinResponse, timestamp: str
+    ) -> dict:
+        url = title = description = size = None
 
+        # Names are compared as raw bytes, so settings we do not care about
+        # are never decoded; only matched values pay for a UTF-8 decode.
         for entry in resp.setting:
-            name_bytes = entry.name or b""
-            value_bytes = entry.value or b""
+            name = entry.name
+            value = entry.value
 
-            value = value_bytes.decode("utf-8", errors="ignore")
-
-            if not info["found"] and (
-                name_bytes == b"update_url" or OTA_URL_PREFIX in value_bytes
+            if url is None and (
+                name == b"update_url" or value.startswith(OTA_URL_PREFIX)
             ):
-                url = value.strip()
-                if url:
-                    info["url"] = url
-                    info["found"] = True
-
-            try:
-                name = name_bytes.decode("utf-8")
-            except Exception as exc:
-                Log.w(
-                    f"Skipping setting with non-UTF-8 name "
-                    f"({len(name_bytes)} bytes): {exc}"
-                )
-                continue
-
-            if name == "update_title":
-                info["title"] = value.strip()
-            elif name == "update_description":
-                info["description"] = value.strip()
-            elif name == "update_size":
-                info["size"] = value
-
-        return info
+                url = value.decode("utf-8", errors="ignore").strip() or None
+
+            # First occurrence wins for every field (as for the URL), so a
+            # duplicated setting resolves the same way whether it arrives before
+            # or after the scan could stop.
+            if title is None and name == b"update_title":
+                title = value.decode("utf-8", errors="ignore").strip()
+            elif description is None and name == b"update_description":
+                description = value.decode("utf-8", errors="ignore").strip()
+            elif size is None and name == b"update_size":
+                size = value.decode("utf-8", errors="ignore")
+
+            # Nothing later can change the result once every field is set, so
+            # stop scanning the (possibly long) settings list.
+            if None not in (url, title, description, size):
+                break
+
+        return {
+            "device": self.cfg.model,
+            "found": url is not None,
+            "timestamp": timestamp,
+            "title": title,
+            "description": description,
+            "size": size,
+            "url": url,
+        }
@@ -0,0 +1,86 @@
+"""--jobs accepts an integer or 'auto'; auto is capped by the variant task count."""
+
+import argparse
+import signal
+
+import pytest
+
+from checkota import cli
+
+_VARIANTS_YAML = (
+    "oem: Infinix\ndevice: Infinix-X6873\nandroid_version: '14'\n"
+    "build_tag: B\nincremental: I\nmodel: Infinix GT 30 Pro\n"
+    "variants:\n"
+    "  - product: X6873-OP\n"
+    "  - product: X6873-RU\n"
+    "  - product: X6873-GL\n"
+)
+
+
+def test_jobs_flag_parses_int_and_auto():
+    parser = cli.build_parser()
+    assert parser.parse_args(["-d", "configs", "--jobs", "3"]).jobs == 3
+    assert parser.parse_args(["-d", "configs", "--jobs", "AUTO"]).jobs == "auto"
+    with pytest.raises(SystemExit):
+        parser.parse_args(["-d", "configs", "--jobs", "many"])
+
+
+def test_auto_jobs_is_capped_by_task_count(monkeypatch):
+    monkeypatch.setattr(cli.os, "cpu_count", lambda: 8)
+    assert cli.auto_jobs(3) == 3
+    assert cli.auto_jobs(100) == 32
+    assert cli.auto_jobs(0) == 1
+
+    monkeypatch.setattr(cli.os, "cpu_count", lambda: None)
+    assert cli.auto_jobs(100) == 4
+
+
+def test_count_variant_tasks_counts_variants_and_applies_region(tmp_path):
+    multi = tmp_path / "config-X6873.yml"
+    multi.write_text(_VARIANTS_YAML, encoding="utf-8")
+    broken = tmp_path / "config-broken.yml"
+    broken.write_text("- not a mapping\n", encoding="utf-8")
+
+    args = argparse.Namespace(region=None, incremental=None)
+    assert cli._count_variant_tasks([multi, broken], args) == 4
+    args.region = "ru"
+    assert cli._count_variant_tasks([multi], args) == 1
+    # No variant matches: a failed config, counted as one task.
+    args.region = "XX"
+    assert cli._count_variant_tasks([multi], args) == 1
+
+
+def test_main_resolves_auto_from_variants_before_run_context(monkeypatch, tmp_path):
+    config = tmp_path / "config-X6873.yml"
+    config.write_text(_VARIANTS_YAML, encoding="utf-8")
+    args = cli.build_parser().parse_args(["-c", str(config), "--jobs", "auto"])
+
+    parser = argparse.ArgumentParser()
+    monkeypatch.setattr(parser, "parse_args", lambda: args)
+    monkeypatch.setattr(cli, "build_parser", lambda: parser)
+    monkeypatch.setattr(cli.os, "cpu_count", lambda: 8)
+    monkeypatch.setattr(cli, "install_interrupt_handler", lambda ctx: signal.SIG_DFL)
+    monkeypatch.setattr(cli, "start_watchdog", lambda ctx, t: None)
+
+    pool_sizes: list[int] = []
+    real_create_run_context = cli.create_run_context
+
+    def create_run_context(dry_run, pool_size):
+        pool_sizes.append(pool_size)
+        return real_create_run_context(dry_run, pool_size=pool_size)
+
+    pool_jobs: list[int] = []
+
+    def run_global_pool(ctx, run_args, config_paths):
+        pool_jobs.append(run_args.jobs)
+        return 0, None
+
+    monkeypatch.setattr(cli, "create_run_context", create_run_context)
+    monkeypatch.setattr(cli, "_run_global_pool", run_global_pool)
+    monkeypatch.setattr(
+        cli, "_run_sequential", lambda *a: pytest.fail("expected the pool")
+    )
+
+    assert cli.main() == 0
+    assert pool_sizes == [3]
+    assert pool_jobs == [3]
@@ -0,0 +1,34 @@
+"""NO_COLOR drops the ANSI codes from Log prefixes (read once at import)."""
+
+import importlib
+import io
+
+import checkota.logging
+
+
+def _log_lines() -> str:
+    buf = io.StringIO()
+    with checkota.logging.Log.capture(buf):
+        checkota.logging.Log.i("info")
+        checkota.logging.Log.e("error")
+    return buf.getvalue()
+
+
+def test_no_color_env_uses_plain_prefixes(monkeypatch):
+    monkeypatch.setenv("NO_COLOR", "1")
+    try:
+        importlib.reload(checkota.logging)
+        assert _log_lines() == "=> info\n✗ error\n"
+    finally:
+        monkeypatch.undo()
+        importlib.reload(checkota.logging)
+
+
+def test_colored_prefixes_without_no_color(monkeypatch):
+    monkeypatch.delenv("NO_COLOR", raising=False)
+    try:
+        importlib.reload(checkota.logging)
+        assert _log_lines() == "\033[94m=>\033[0m info\n\033[91m✗\033[0m error\n"
+    finally:
+        monkeypatch.undo()
+        importlib.reload(checkota.logging)
@@ -65,3 +65,45 @@ def test_post_write_yaml_round_trip_parses(tmp_path):
     assert reparsed["android_version"] == "16"
     assert reparsed["build_tag"] == "BP2A.250605.031.A3"
     assert reparsed["incremental"] == "201350016"
+
+
+def test_from_yaml_reuses_parse_until_file_changes(tmp_path, monkeypatch):
+    """Config.from_yaml reuses the cached parse for an unchanged file and
+    re-parses once the file is rewritten."""
+    from checkota import manager
+
+    p = _write_config(tmp_path)
+    calls = {"n": 0}
+    real_load = manager._safe_load_yaml
+
+    def counting_load(stream):
+        calls["n"] += 1
+        return real_load(stream)
+
+    monkeypatch.setattr(manager, "_safe_load_yaml", counting_load)
+
+    first = Config.from_yaml(p)
+    second = Config.from_yaml(p)
+    assert calls["n"] == 1
+    assert first == second
+    assert first[0] is not second[0], "callers must get independent Config objects"
+
+    assert update_config_from_fingerprint(p, first[0], FP)
+    assert Config.from_yaml(p)[0].incremental == "201350016"
+
+
+def test_same_size_rewrite_is_not_served_from_cache(tmp_path):
+    """A rewrite that keeps the file size and (coarse) mtime must still be
+    visible to the next Config.from_yaml call."""
+    import os
+
+    p = _write_config(tmp_path)
+    cfg = _cfg(p)
+    before = p.stat()
+
+    same_size_fp = "Infinix/X6873-OP/Infinix-X6873:14/B/J:user/release-keys"
+    assert update_config_from_fingerprint(p, cfg, same_size_fp)
+    os.utime(p, ns=(before.st_atime_ns, before.st_mtime_ns))
+    assert p.stat().st_size == before.st_size
+
+    assert _cfg(p).incremental == "J"
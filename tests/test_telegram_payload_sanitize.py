@@ -101,3 +101,70 @@ def test_over_limit_payload_preserves_telegraph_link_and_escaped_desc():
     assert "<small>" not in text
     assert "<font" not in text
     assert "<br" not in text
+
+
+def test_identical_long_descriptions_share_one_telegraph_page():
+    long_desc = "Shared changelog line. " * 300
+    session = _Session()
+    page_cache: dict[tuple[str, str], str] = {}
+    for _ in range(2):
+        # A fresh notifier per send, as create_notifier does per variant.
+        notifier = TgNotify(
+            "token",
+            "chat",
+            "telegraph",
+            session=session,  # type: ignore[arg-type]
+            page_cache=page_cache,
+        )
+        assert notifier.send(build_notification_message(_update(long_desc)))
+
+    telegraph_posts = [p for p in session.posts if "telegra.ph" in p[0]]
+    assert len(telegraph_posts) == 1
+    assert list(page_cache.values()) == ["https://telegra.ph/full"]
+    assert "Read full changelogs" in session.posts[-1][1]["text"]
+
+
+def test_telegraph_pages_are_not_reused_without_a_cache():
+    long_desc = "Shared changelog line. " * 300
+    session = _Session()
+    notifier = TgNotify("token", "chat", "telegraph", session=session)  # type: ignore[arg-type]
+    for _ in range(2):
+        assert notifier.send(build_notification_message(_update(long_desc)))
+
+    telegraph_posts = [p for p in session.posts if "telegra.ph" in p[0]]
+    assert len(telegraph_posts) == 2
+
+
+def test_bullets_and_stray_a_circumflex_are_normalized():
+    text = TgNotify._sanitize_html("Â· one\n• two\n‣ three\n⁃ four\n∙ five")
+    assert text == "- one\n- two\n- three\n- four\n- five"
+
+
+def test_create_notifier_shares_the_run_page_cache(tmp_path):
+    import argparse
+
+    from checkota.notifier import create_notifier
+    from checkota.runtime import RunContext
+
+    ctx = RunContext(
+        env={"bot_token": "t", "chat_id": "c", "telegraph_token": "p"},
+        processed_path=tmp_path / "processed_updates.txt",
+        processed_titles=set(),
+        dry_run=False,
+    )
+    args = argparse.Namespace(skip_telegram=False, register_update=False)
+    notifier = create_notifier(ctx, args)
+    assert notifier is not None
+    assert notifier.page_cache is ctx.telegraph_pages
+    assert notifier.cache_lock is ctx.cache_lock
+    ctx.stop()
+
+
+def test_stray_less_than_a_does_not_swallow_a_later_font_tag():
+    text = TgNotify._sanitize_html(
+        'Battery life < a few hours fixed <font color="red">important</font>'
+    )
+    assert text == "Battery life &lt; a few hours fixed important"
+
+    nodes = TgNotify._html_to_telegraph_nodes("volume <a bit low <small>note</small>")
+    assert nodes == [{"tag": "p", "children": ["volume <a bit low note"]}]
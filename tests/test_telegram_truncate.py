@@ -0,0 +1,37 @@
+"""_truncate_desc boundary search matches the former regex-based behaviour."""
+
+import re
+
+from checkota.telegram import TgNotify
+
+
+def _regex_sentence_end(text: str, threshold: float) -> int:
+    endings = [m.end() - 1 for m in re.finditer(r"\.\s+", text)]
+    return endings[-1] if endings and endings[-1] > threshold else -1
+
+
+def test_last_sentence_end_matches_regex_scan():
+    samples = [
+        "No sentences here at all",
+        "One. Two. Three.",
+        "Ends with dot.",
+        "Version 1.2.3 fixes. More text follows here",
+        "a." * 40 + " tail",
+        "x" * 50 + ".\n" + "y" * 49,
+        "x" * 50 + ".\t" + "y" * 10 + ". z",
+        "Paragraph one.\n\n  Paragraph two",
+    ]
+    for text in samples:
+        for limit in (10, 33, 60, len(text)):
+            threshold = limit * 0.6
+            expected = _regex_sentence_end(text, threshold)
+            got = TgNotify._last_sentence_end(text)
+            assert (got if got > threshold else -1) == expected, (text, limit)
+
+
+def test_truncate_prefers_sentence_boundary():
+    notifier = TgNotify("t", "c", "g", session=object())
+    desc = "First sentence here. " * 10
+    out = notifier._truncate_desc(desc, max_len=100)
+    assert out.endswith("here. ...")
+    assert len(out) <= 103
@@ -0,0 +1,128 @@
+"""UpdateChecker._parse extracts update settings from a check-in response."""
+
+import gzip
+from unittest.mock import MagicMock
+
+from checkota.paths import ensure_vendor_on_path
+
+ensure_vendor_on_path()
+
+from checkin import checkin_generator_pb2  # noqa: E402
+
+from checkota.manager import Config  # noqa: E402
+from checkota.update_checker import _REQUEST_TEMPLATE, UpdateChecker  # noqa: E402
+
+TS = "2026-01-01T00:00:00+00:00"
+OTA_URL = "https://android.googleapis.com/packages/ota-api/package/abc.zip"
+
+
+def _checker(imei: str | None = None) -> UpdateChecker:
+    cfg = Config(
+        oem="Infinix",
+        product="X6873-OP",
+        device="Infinix-X6873",
+        android_version="14",
+        build_tag="B",
+        incremental="I",
+        model="Infinix GT 30 Pro",
+    )
+    return UpdateChecker(cfg, session=MagicMock(), imei=imei)
+
+
+def _response(*settings: tuple[bytes, bytes]):
+    resp = checkin_generator_pb2.AndroidCheckinResponse()
+    for name, value in settings:
+        entry = resp.setting.add()
+        entry.name = name
+        entry.value = value
+    return resp
+
+
+def test_parse_collects_update_fields():
+    info = _checker()._parse(
+        _response(
+            (b"\xff\xfe", b"ignored non-utf8 name"),
+            (b"update_title", b"  X6873-H8914 \n"),
+            (b"update_description", "Café fixes".encode()),
+            (b"update_size", b"2.1 GB"),
+            (b"update_url", f" {OTA_URL} ".encode()),
+        ),
+        TS,
+    )
+    assert info["found"] is True
+    assert info["url"] == OTA_URL
+    assert info["title"] == "X6873-H8914"
+    assert info["description"] == "Café fixes"
+    assert info["size"] == "2.1 GB"
+    assert info["device"] == "Infinix GT 30 Pro"
+    assert info["timestamp"] == TS
+
+
+def test_parse_detects_url_by_value_prefix_and_keeps_first():
+    info = _checker()._parse(
+        _response(
+            (b"some_other_key", OTA_URL.encode()),
+            (b"update_url", b"https://example.com/second.zip"),
+        ),
+        TS,
+    )
+    assert info["url"] == OTA_URL
+
+
+def test_parse_without_url_is_not_found():
+    info = _checker()._parse(
+        _response((b"update_title", b"T"), (b"update_url", b" ")), TS
+    )
+    assert info["found"] is False
+    assert info["url"] is None
+    assert info["title"] == "T"
+
+
+def test_parse_stops_after_all_fields_found():
+    info = _checker()._parse(
+        _response(
+            (b"update_url", OTA_URL.encode()),
+            (b"update_title", b"first"),
+            (b"update_description", b"d"),
+            (b"update_size", b"1 GB"),
+            (b"update_title", b"late duplicate"),
+        ),
+        TS,
+    )
+    assert info["title"] == "first"
+
+
+def test_parse_keeps_first_duplicate_before_all_fields_found():
+    info = _checker()._parse(
+        _response(
+            (b"update_title", b"first"),
+            (b"update_title", b"second"),
+            (b"update_description", b"d1"),
+            (b"update_description", b"d2"),
+            (b"update_size", b"1 GB"),
+            (b"update_size", b"2 GB"),
+            (b"update_url", OTA_URL.encode()),
+        ),
+        TS,
+    )
+    assert info["title"] == "first"
+    assert info["description"] == "d1"
+    assert info["size"] == "1 GB"
+
+
+def test_request_template_not_mutated_by_builds():
+    """Per-device fields are set on a copy; the shared template stays clean and
+    every request carries exactly one MAC address."""
+    checker = _checker(imei="123456789012345")
+    for _ in range(2):
+        payload = checkin_generator_pb2.AndroidCheckinRequest()
+        payload.ParseFromString(gzip.decompress(checker._build_request()))
+        assert payload.imei == "123456789012345"
+        assert len(payload.macAddr) == 1
+        assert list(payload.macAddrType) == ["wifi"]
+        assert payload.checkin.build.id == checker.cfg.fingerprint()
+        assert payload.fetchSystemUpdates == 1
+
+    assert not _REQUEST_TEMPLATE.imei
+    assert not _REQUEST_TEMPLATE.macAddr
+    assert not _REQUEST_TEMPLATE.checkin.build.id